@@ -16,19 +16,26 @@ APIs used (all free, no API keys needed):
   - CryptoCompare: LTC price (current + historical)
 """
 
-import json
+import heapq
 import re
+import threading
 import time
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 
 try:
+    import ijson
+    import orjson
     import requests
-except ImportError:
-    print("\n  [!] Missing 'requests' library.\n")
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError as e:
+    print(f"\n  [!] Missing '{e.name}' library.\n")
     print("  Install it with:")
-    print("    pip install requests")
+    print(f"    pip install {e.name}")
     print("  Or:")
     print("    pip install -r requirements.txt\n")
     sys.exit(1)
@@ -40,6 +47,7 @@ SCRIPT_DIR = Path(__file__).parent
 CONFIG_PATH = SCRIPT_DIR / "config.json"
 DATA_PATH = SCRIPT_DIR / "data.json"
 DATA_JS_PATH = SCRIPT_DIR / "data.js"
+PRICE_CACHE_PATH = SCRIPT_DIR / "price_cache.json"
 
 # ---------------------------------------------------------------------------
 # API endpoints
@@ -47,10 +55,65 @@ DATA_JS_PATH = SCRIPT_DIR / "data.js"
 BLOCKCYPHER_BASE = "https://api.blockcypher.com/v1/ltc/main"
 CRYPTOCOMPARE_BASE = "https://min-api.cryptocompare.com/data"
 
-# Cache for historical prices (avoids duplicate API calls within a run)
+# Max number of daily candles CryptoCompare's histoday returns per call
+HISTODAY_MAX_DAYS = 2000
+
+# Addresses are fetched in parallel; the rate limiters below keep us under
+# Blockcypher's free-tier limit (3 req/s)
+BLOCKCYPHER_WORKERS = 3
+
+# One shared session so requests reuse keep-alive connections (no new
+# TCP + TLS handshake per call) and transient errors / 429s are retried
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(
+        total=4,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+    pool_connections=8,
+    pool_maxsize=8,
+))
+
+# Basic validation: LTC addresses start with L, M, 3, or ltc1
+_LTC_ADDR_RE = re.compile(r'^(ltc1|[LM3])[a-zA-Z0-9]{25,62}$')
+
+# Cache for historical prices, keyed "YYYY-MM-DD|CCY". Persisted to
+# price_cache.json so past prices are never fetched twice.
 _price_cache = {}
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+class RateLimiter:
+    """
+    Space out requests to one host to at most `rps` per second. Only sleeps
+    for whatever is left of the interval, so slow responses aren't padded
+    with a fixed delay on top. Safe to share between worker threads.
+
+    `cost` is how many API calls one request counts as (e.g. a batched
+    lookup of several addresses); later requests wait for all of them.
+    """
+
+    def __init__(self, rps):
+        self.min_interval = 1 / rps
+        self.next_allowed = 0
+        self._lock = threading.Lock()
+
+    def wait(self, cost=1):
+        with self._lock:
+            now = time.monotonic()
+            delay = self.next_allowed - now
+            self.next_allowed = max(now, self.next_allowed) + self.min_interval * cost
+        if delay > 0:
+            time.sleep(delay)
+
+
+BC_LIMITER = RateLimiter(rps=2.5)
+CC_LIMITER = RateLimiter(rps=3)
+
+
 # ---------------------------------------------------------------------------
 # First-run interactive setup
 # ---------------------------------------------------------------------------
@@ -69,6 +132,7 @@ def interactive_setup():
     print()
 
     addresses = []
+    added = set()
     print("  Paste your LTC addresses one by one.")
     print("  Press Enter on an empty line when done.\n")
 
@@ -82,16 +146,16 @@ def interactive_setup():
                 continue
             break
 
-        # Basic validation: LTC addresses start with L, M, 3, or ltc1
-        if not re.match(r'^(ltc1|[LM3])[a-zA-Z0-9]{25,62}$', addr):
+        if not _LTC_ADDR_RE.match(addr):
             print("  [!] That doesn't look like a valid LTC address. Try again.\n")
             continue
 
-        if addr in addresses:
+        if addr in added:
             print("  [!] Duplicate address, skipping.\n")
             continue
 
         addresses.append(addr)
+        added.add(addr)
         print(f"  [✓] Added ({len(addresses)} total)\n")
 
     # Target profit
@@ -119,8 +183,7 @@ def interactive_setup():
         "currency": currency
     }
 
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_PATH.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
     print(f"\n  [✓] Config saved to config.json")
     print(f"  [i] Tracking {len(addresses)} address(es) with {target_profit}% target\n")
@@ -136,8 +199,7 @@ def load_config():
     if not CONFIG_PATH.exists():
         return interactive_setup()
 
-    with open(CONFIG_PATH) as f:
-        cfg = json.load(f)
+    cfg = orjson.loads(CONFIG_PATH.read_bytes())
 
     # Check for placeholder addresses
     if not cfg.get("addresses") or any(a.startswith("YOUR_") for a in cfg["addresses"]):
@@ -155,8 +217,7 @@ def load_config():
 def load_data():
     """Load existing data.json or return empty structure."""
     if DATA_PATH.exists():
-        with open(DATA_PATH) as f:
-            return json.load(f)
+        return orjson.loads(DATA_PATH.read_bytes())
     return {
         "transactions": [],
         "seen_txids": [],
@@ -169,19 +230,40 @@ def save_data(data):
     """Save data.json and data.js (for the dashboard)."""
     data["last_updated"] = datetime.now(timezone.utc).isoformat()
 
-    with open(DATA_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    # Serialize once and reuse the payload for both files
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    DATA_PATH.write_bytes(payload)
 
     # Write data.js so dashboard.html works when opened directly via file://
-    with open(DATA_JS_PATH, "w") as f:
-        f.write("// Auto-generated by tracker.py — do not edit\n")
-        f.write("var LTC_DATA = ")
-        json.dump(data, f, indent=2)
-        f.write(";\n")
+    DATA_JS_PATH.write_bytes(
+        "// Auto-generated by tracker.py — do not edit\n".encode()
+        + b"var LTC_DATA = " + payload + b";\n"
+    )
+
+    save_price_cache()
 
     print(f"[✓] Saved data.json + data.js")
 
 
+def load_price_cache():
+    """Load price_cache.json into the in-memory price cache."""
+    if PRICE_CACHE_PATH.exists():
+        try:
+            _price_cache.update(orjson.loads(PRICE_CACHE_PATH.read_bytes()))
+        except (OSError, ValueError) as e:
+            print(f"[!] Ignoring unreadable {PRICE_CACHE_PATH.name}: {e}")
+
+
+def save_price_cache():
+    """Write the price cache to disk. Kept on --reset: past prices never change."""
+    # Today's (UTC) price is still moving, so only closed days are persisted
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    closed = {k: v for k, v in _price_cache.items() if k.split("|")[0] < today}
+    PRICE_CACHE_PATH.write_bytes(
+        orjson.dumps(closed, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+
+
 def reset_data():
     """Delete data files and optionally config."""
     for f in [DATA_PATH, DATA_JS_PATH]:
@@ -207,45 +289,152 @@ def reset_data():
 def get_current_price(currency="usd"):
     """Fetch current LTC price."""
     try:
-        r = requests.get(
+        r = _SESSION.get(
             f"{CRYPTOCOMPARE_BASE}/price",
             params={"fsym": "LTC", "tsyms": currency.upper()},
             timeout=10
         )
         r.raise_for_status()
-        return r.json()[currency.upper()]
+        return orjson.loads(r.content)[currency.upper()]
     except Exception as e:
         print(f"[!] Failed to fetch current price: {e}")
         return None
 
 
 def get_historical_price(date_str, currency="usd"):
-    """Fetch LTC price for a specific date (YYYY-MM-DD). Cached per-run."""
-    if date_str in _price_cache:
-        return _price_cache[date_str]
+    """
+    Fetch LTC price for a specific date (YYYY-MM-DD). Cached, so dates
+    already covered by prefetch_price_range() or a previous run cost no
+    request.
+    """
+    key = f"{date_str}|{currency.upper()}"
+    if key in _price_cache:
+        return _price_cache[key]
 
     dt = datetime.strptime(date_str, "%Y-%m-%d")
     ts = int(dt.replace(tzinfo=timezone.utc).timestamp())
 
     try:
-        time.sleep(0.3)
-        r = requests.get(
+        CC_LIMITER.wait()
+        r = _SESSION.get(
             f"{CRYPTOCOMPARE_BASE}/pricehistorical",
             params={"fsym": "LTC", "tsyms": currency.upper(), "ts": ts},
             timeout=15
         )
         r.raise_for_status()
-        price = r.json()["LTC"][currency.upper()]
-        _price_cache[date_str] = price
+        price = orjson.loads(r.content)["LTC"][currency.upper()]
+        _price_cache[key] = price
         return price
     except Exception as e:
         print(f"[!] Failed to fetch price for {date_str}: {e}")
         return None
 
 
+def prefetch_price_range(start_date, end_date, currency="usd"):
+    """
+    Fill the price cache with daily closes for every date in
+    [start_date, end_date] (YYYY-MM-DD) using as few histoday calls as
+    possible. Dates that come back missing are left to
+    get_historical_price() to fetch individually.
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+    # histoday returns limit + 1 candles ending at toTs, so walk backwards.
+    # Its minimum limit is 1, so a single-day range fetches one extra day.
+    while end >= start:
+        ndays = min((end - start).days, HISTODAY_MAX_DAYS - 1)
+        try:
+            CC_LIMITER.wait()
+            r = _SESSION.get(
+                f"{CRYPTOCOMPARE_BASE}/v2/histoday",
+                params={
+                    "fsym": "LTC",
+                    "tsym": currency.upper(),
+                    "limit": max(ndays, 1),
+                    "toTs": int(end.timestamp()),
+                },
+                timeout=15
+            )
+            r.raise_for_status()
+            payload = orjson.loads(r.content)
+            if payload.get("Response") != "Success":
+                raise ValueError(payload.get("Message", "unexpected response"))
+            for candle in payload["Data"]["Data"]:
+                if candle.get("close"):
+                    day = datetime.fromtimestamp(candle["time"], tz=timezone.utc)
+                    key = f"{day.strftime('%Y-%m-%d')}|{currency.upper()}"
+                    _price_cache[key] = candle["close"]
+        except Exception as e:
+            print(f"[!] Failed to fetch prices for {start_date} → {end_date}: {e}")
+            break
+
+        end -= timedelta(days=ndays + 1)
+
+    save_price_cache()
+
+
 # ---------------------------------------------------------------------------
 # Blockchain API helpers (Blockcypher — free, no key needed)
 # ---------------------------------------------------------------------------
+def blockcypher_get(url, cost=1, **kwargs):
+    """GET a Blockcypher URL, respecting the shared rate limit."""
+    BC_LIMITER.wait(cost)
+    return _SESSION.get(url, **kwargs)
+
+
+# JSON paths (as ijson prefixes) of the /full fields parse_all_transactions
+# reads. Everything else (scripts, witnesses, confidence, ...) is skipped
+# while streaming, so it is never built into Python objects.
+_TX_FIELDS = frozenset([
+    "txs.item",
+    "txs.item.hash",
+    "txs.item.confirmed",
+    "txs.item.block_height",
+    "txs.item.inputs",
+    "txs.item.inputs.item",
+    "txs.item.inputs.item.addresses",
+    "txs.item.inputs.item.addresses.item",
+    "txs.item.inputs.item.output_value",
+    "txs.item.inputs.item.value",
+    "txs.item.outputs",
+    "txs.item.outputs.item",
+    "txs.item.outputs.item.addresses",
+    "txs.item.outputs.item.addresses.item",
+    "txs.item.outputs.item.value",
+])
+
+
+def _stream_txs_page(stream):
+    """
+    Stream-parse one /full response page, building one lean tx dict at a
+    time from the fields in _TX_FIELDS. Returns (txs, has_more).
+    """
+    txs = []
+    has_more = False
+    builder = None
+
+    for prefix, event, value in ijson.parse(stream):
+        if event == "map_key":
+            path = f"{prefix}.{value}" if prefix else value
+        else:
+            path = prefix
+
+        if path not in _TX_FIELDS:
+            if prefix == "hasMore":
+                has_more = value
+            continue
+
+        if prefix == "txs.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        if prefix == "txs.item" and event == "end_map":
+            txs.append(builder.value)
+            builder = None
+
+    return txs, has_more
+
+
 def fetch_address_txs(address, max_txs=500, after_block=None):
     """
     Fetch transactions for an LTC address. Handles pagination.
@@ -254,6 +443,9 @@ def fetch_address_txs(address, max_txs=500, after_block=None):
         address: LTC address
         max_txs: Stop after fetching this many transactions (0 = unlimited)
         after_block: Only fetch transactions in blocks after this height
+
+    Returns (txs, complete); complete is False if a request failed and
+    the history may be missing pages.
     """
     txs = []
     url = f"{BLOCKCYPHER_BASE}/addrs/{address}/full"
@@ -265,49 +457,71 @@ def fetch_address_txs(address, max_txs=500, after_block=None):
 
     while url:
         try:
-            time.sleep(0.5)
-            r = requests.get(url, params=params, timeout=20)
-            r.raise_for_status()
-            data = r.json()
-
-            txs.extend(data.get("txs", []))
-
-            # Check if we hit our limit
-            if max_txs > 0 and len(txs) >= max_txs:
-                txs = txs[:max_txs]
-                break
+            with blockcypher_get(url, params=params, timeout=20, stream=True) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                page, has_more = _stream_txs_page(r.raw)
+
+            # Only take what's left under the limit, instead of trimming
+            # an oversized list afterwards
+            if max_txs > 0:
+                txs.extend(islice(page, max_txs - len(txs)))
+                if len(txs) >= max_txs:
+                    break
+            else:
+                txs.extend(page)
 
-            if data.get("hasMore"):
-                last_tx = data["txs"][-1]
+            if has_more and page:
+                last_tx = page[-1]
                 params["before"] = last_tx.get("block_height", 0)
             else:
                 break
         except Exception as e:
             print(f"[!] Error fetching txs for {address[:12]}...: {e}")
-            break
+            return txs, False
 
-    return txs
+    return txs, True
 
 
-def fetch_address_balance(address):
-    """Fetch confirmed balance and tx count for a single address."""
-    try:
-        time.sleep(0.5)
-        r = requests.get(f"{BLOCKCYPHER_BASE}/addrs/{address}/balance", timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        balance = data.get("balance", 0) / 1e8
-        n_tx = data.get("n_tx", 0)
-        return balance, n_tx
-    except Exception as e:
-        print(f"    [!] Could not fetch balance: {e}")
-        return None, 0
+def fetch_balances_batch(addresses, chunk=3):
+    """
+    Fetch confirmed balance and tx count for many addresses at once.
+
+    Blockcypher accepts semicolon-separated addresses on the balance
+    endpoint, so N addresses cost ceil(N / chunk) round-trips instead of N.
+    Returns {address: (balance_ltc, n_tx)}; failed lookups map to (None, 0).
+    """
+    balances = {}
+    for i in range(0, len(addresses), chunk):
+        batch = addresses[i:i + chunk]
+        try:
+            r = blockcypher_get(
+                f"{BLOCKCYPHER_BASE}/addrs/{';'.join(batch)}/balance",
+                # Blockcypher bills every address in a batch as one call
+                cost=len(batch),
+                timeout=15
+            )
+            r.raise_for_status()
+            data = orjson.loads(r.content)
+            # A single address comes back as an object, several as a list
+            if isinstance(data, dict):
+                data = [data]
+            for entry in data:
+                if "address" in entry and "error" not in entry:
+                    balances[entry["address"]] = (
+                        entry.get("balance", 0) / 1e8,
+                        entry.get("n_tx", 0),
+                    )
+        except Exception as e:
+            print(f"[!] Could not fetch balances for {len(batch)} address(es): {e}")
+
+    return {addr: balances.get(addr, (None, 0)) for addr in addresses}
 
 
 # ---------------------------------------------------------------------------
 # Transaction parsing
 # ---------------------------------------------------------------------------
-def parse_all_transactions(all_raw_txs, tracked_addresses):
+def parse_all_transactions(all_raw_txs, tracked_addresses, skip_txids=frozenset()):
     """
     Parse raw Blockcypher transactions considering ALL tracked addresses
     together. This correctly handles:
@@ -318,14 +532,20 @@ def parse_all_transactions(all_raw_txs, tracked_addresses):
     For each unique txid, we sum ALL inputs from tracked addresses and
     ALL outputs TO tracked addresses, so internal moves net to zero
     (minus the tx fee).
+
+    Txids in `skip_txids` (already recorded on a previous run) are not
+    parsed at all.
     """
     tracked_set = set(tracked_addresses)
+    is_untracked = tracked_set.isdisjoint
     parsed = []
 
     # Deduplicate: same tx appears when fetching from multiple addresses
     unique_txs = {}
     for tx in all_raw_txs:
         txid = tx.get("hash", "")
+        if txid in skip_txids:
+            continue
         if txid and txid not in unique_txs:
             unique_txs[txid] = tx
 
@@ -334,26 +554,37 @@ def parse_all_transactions(all_raw_txs, tracked_addresses):
         if not confirmed:
             continue
 
-        dt = datetime.fromisoformat(confirmed.replace("Z", "+00:00"))
-        date_str = dt.strftime("%Y-%m-%d")
-        timestamp = dt.isoformat()
+        # Blockcypher timestamps are UTC ISO strings ("YYYY-MM-DDTHH:MM:SSZ"),
+        # so the date is just the prefix — no need to strftime it
+        date_str = confirmed[:10]
+        timestamp = datetime.fromisoformat(confirmed.replace("Z", "+00:00")).isoformat()
 
         total_received = 0
         total_sent = 0
         involved_addresses = set()
 
-        for out in tx.get("outputs", []):
-            for addr in out.get("addresses", []):
+        # Most inputs/outputs belong to other people: rule them out with one
+        # set check before looking at values
+        for out in tx.get("outputs") or ():
+            out_addrs = out.get("addresses") or ()
+            if is_untracked(out_addrs):
+                continue
+            value = out.get("value", 0)
+            for addr in out_addrs:
                 if addr in tracked_set:
-                    total_received += out.get("value", 0)
+                    total_received += value
                     involved_addresses.add(addr)
 
-        for inp in tx.get("inputs", []):
-            for addr in inp.get("addresses", []):
+        for inp in tx.get("inputs") or ():
+            inp_addrs = inp.get("addresses") or ()
+            if is_untracked(inp_addrs):
+                continue
+            # Blockcypher uses "output_value" for inputs (the value
+            # of the previous output being spent), NOT "value"
+            value = inp.get("output_value", inp.get("value", 0))
+            for addr in inp_addrs:
                 if addr in tracked_set:
-                    # Blockcypher uses "output_value" for inputs (the value
-                    # of the previous output being spent), NOT "value"
-                    total_sent += inp.get("output_value", inp.get("value", 0))
+                    total_sent += value
                     involved_addresses.add(addr)
 
         net_litoshis = total_received - total_sent
@@ -384,18 +615,26 @@ def parse_all_transactions(all_raw_txs, tracked_addresses):
 # ---------------------------------------------------------------------------
 def calculate_summary(transactions, current_price, target_profit_pct):
     """Calculate weighted average cost basis and P/L."""
-    receives = sorted(
-        [t for t in transactions if t["type"] == "receive" and t.get("price_usd")],
-        key=lambda t: t["timestamp"]
-    )
-    spends = sorted(
-        [t for t in transactions if t["type"] == "spend" and t.get("price_usd")],
-        key=lambda t: t["timestamp"]
-    )
-
-    total_received_ltc = sum(t["amount_ltc"] for t in receives)
-    total_cost = sum(t["amount_ltc"] * t["price_usd"] for t in receives)
-    total_spent_ltc = sum(t["amount_ltc"] for t in spends)
+    total_received_ltc = 0
+    total_cost = 0
+    total_spent_ltc = 0
+    n_receives = 0
+    n_spends = 0
+
+    # Single pass; txs still waiting on a price are left out
+    for t in transactions:
+        price = t.get("price_usd")
+        if not price:
+            continue
+        amount = t["amount_ltc"]
+        tx_type = t["type"]
+        if tx_type == "receive":
+            total_received_ltc += amount
+            total_cost += amount * price
+            n_receives += 1
+        elif tx_type == "spend":
+            total_spent_ltc += amount
+            n_spends += 1
 
     balance_ltc = total_received_ltc - total_spent_ltc
 
@@ -425,9 +664,9 @@ def calculate_summary(transactions, current_price, target_profit_pct):
         "current_value_usd": round(current_value, 2) if current_value else None,
         "unrealized_pl_usd": round(unrealized_pl, 2) if unrealized_pl is not None else None,
         "unrealized_pl_pct": round(unrealized_pl_pct, 2) if unrealized_pl_pct is not None else None,
-        "total_transactions": len(receives) + len(spends),
-        "total_receives": len(receives),
-        "total_spends": len(spends),
+        "total_transactions": n_receives + n_spends,
+        "total_receives": n_receives,
+        "total_spends": n_spends,
     }
 
 
@@ -448,6 +687,7 @@ def main():
 
     config = load_config()
     data = load_data()
+    load_price_cache()
     addresses = config["addresses"]
     target_profit = config.get("target_profit_percent", 3.0)
     currency = config.get("currency", "usd")
@@ -460,34 +700,69 @@ def main():
     seen_txids = set(data.get("seen_txids", []))
     existing_txs = data.get("transactions", [])
     last_block = data.get("last_block_height", None)
-    new_count = 0
     is_first_run = len(existing_txs) == 0
 
     # --- Fetch transactions + balances from all addresses ---
     all_raw_txs = []
+    seen_raw = set()
     api_balance_total = 0
     highest_block = last_block or 0
     skipped_addresses = []
+    incomplete_addresses = []
+
+    # On re-runs, only fetch transactions after the last known block
+    after_block = None if is_first_run else last_block
+
+    print(f"\n[→] Fetching {len(addresses)} address(es)...")
+    balances = fetch_balances_batch(addresses)
+
+    # An address whose on-chain tx count hasn't changed since the last
+    # complete sync has no new activity, so skip its (paginated) history
+    prev_n_tx = data.get("per_address_n_tx", {})
+    per_address_n_tx = dict(prev_n_tx)
+    if not is_first_run and not full_sync:
+        skipped_addresses = [
+            a for a in addresses
+            if balances[a][0] is not None and prev_n_tx.get(a) == balances[a][1]
+        ]
+    to_fetch = [a for a in addresses if a not in skipped_addresses]
+
+    with ThreadPoolExecutor(max_workers=BLOCKCYPHER_WORKERS) as pool:
+        results = dict(zip(to_fetch, pool.map(
+            lambda a: fetch_address_txs(a, max_txs=max_txs, after_block=after_block),
+            to_fetch
+        )))
 
     for addr in addresses:
         short = addr[:10] + "..." + addr[-6:]
         print(f"\n[→] {short}")
 
-        balance, n_tx = fetch_address_balance(addr)
+        balance, n_tx = balances[addr]
         if balance is not None:
             api_balance_total += balance
             print(f"    Balance: {balance:.8f} LTC  ({n_tx} txs on-chain)")
 
+        if addr not in results:
+            print(f"    No change since last sync, skipped")
+            continue
+
+        raw_txs, complete = results[addr]
+
+        # Only remember the tx count once the history fetch succeeded,
+        # otherwise the next run could wrongly skip this address
+        if complete and balance is not None:
+            per_address_n_tx[addr] = n_tx
+        else:
+            per_address_n_tx.pop(addr, None)
+        if not complete:
+            incomplete_addresses.append(addr)
+
         # Warn about very large addresses
         if n_tx > 5000 and max_txs > 0 and is_first_run:
             print(f"    ⚠️  This address has {n_tx:,} transactions!")
-            print(f"    Fetching most recent {max_txs} only.")
+            print(f"    Fetched the most recent {max_txs} only.")
             print(f"    Use --full flag to fetch everything (will be slow).")
 
-        # On re-runs, only fetch transactions after the last known block
-        after_block = None if is_first_run else last_block
-
-        raw_txs = fetch_address_txs(addr, max_txs=max_txs, after_block=after_block)
         fetched = len(raw_txs)
 
         if after_block and fetched == 0:
@@ -496,44 +771,71 @@ def main():
             print(f"    Fetched: {fetched} transactions")
 
         # Track highest block height we've seen
-        for tx in raw_txs:
-            bh = tx.get("block_height", 0)
-            if bh and bh > highest_block:
-                highest_block = bh
+        highest_block = max(
+            highest_block,
+            max((tx.get("block_height") or 0 for tx in raw_txs), default=0),
+        )
 
-        all_raw_txs.extend(raw_txs)
+        # A tx touching several tracked addresses is returned once per
+        # address; only keep the first copy
+        new_raw = [t for t in raw_txs if t.get("hash") and t["hash"] not in seen_raw]
+        seen_raw.update(t["hash"] for t in new_raw)
+        all_raw_txs.extend(new_raw)
 
-    print(f"\n[i] Total on-chain balance: {api_balance_total:.4f} LTC")
+    # If any history fetch failed, don't advance the sync point: the next
+    # run must re-fetch from the old height or that address's missing
+    # transactions below the new height would never be picked up
+    if incomplete_addresses:
+        highest_block = last_block
+        print(f"\n[!] {len(incomplete_addresses)} address(es) failed to sync fully, will retry next run")
+
+    print()
+    if skipped_addresses:
+        print(f"[i] {len(skipped_addresses)} address(es) unchanged, history not re-fetched")
+    print(f"[i] Total on-chain balance: {api_balance_total:.4f} LTC")
 
     # --- Parse together (handles internal transfers correctly) ---
-    parsed = parse_all_transactions(all_raw_txs, addresses)
+    parsed = parse_all_transactions(all_raw_txs, addresses, skip_txids=seen_txids)
 
-    for tx in parsed:
-        if tx["txid"] not in seen_txids:
-            existing_txs.append(tx)
-            seen_txids.add(tx["txid"])
-            new_count += 1
+    new_txs = [t for t in parsed if t["txid"] not in seen_txids]
+    seen_txids.update(t["txid"] for t in new_txs)
+    # existing_txs is kept sorted by timestamp (it's saved that way), so
+    # merging in the new ones is linear instead of a full re-sort
+    by_timestamp = lambda t: t["timestamp"]
+    existing_txs = list(heapq.merge(
+        existing_txs, sorted(new_txs, key=by_timestamp), key=by_timestamp
+    ))
 
-    print(f"[+] {new_count} new transaction(s)")
+    print(f"[+] {len(new_txs)} new transaction(s)")
 
     # --- Fetch historical prices for new dates ---
-    dates_needed = set()
+    # Index unpriced txs by date so each fetched price is applied directly
+    by_date = {}
     for tx in existing_txs:
         if tx.get("price_usd") is None:
-            dates_needed.add(tx["date"])
-
-    if dates_needed:
-        print(f"\n[→] Fetching prices for {len(dates_needed)} date(s)...")
-        for date_str in sorted(dates_needed):
+            by_date.setdefault(tx["date"], []).append(tx)
+
+    if by_date:
+        print(f"\n[→] Fetching prices for {len(by_date)} date(s)...")
+        # Only range-fetch dates the (persisted) cache can't answer
+        uncached = [
+            d for d in by_date if f"{d}|{currency.upper()}" not in _price_cache
+        ]
+        if uncached:
+            prefetch_price_range(min(uncached), max(uncached), currency)
+        for date_str in sorted(by_date):
             price = get_historical_price(date_str, currency)
             if price:
                 print(f"    {date_str}: ${price:.2f}")
-                for tx in existing_txs:
-                    if tx["date"] == date_str and tx.get("price_usd") is None:
-                        tx["price_usd"] = price
+                for tx in by_date[date_str]:
+                    tx["price_usd"] = price
             else:
                 print(f"    {date_str}: unavailable (will retry next run)")
 
+        # Persist prices fetched one date at a time right away, so an
+        # interrupted run doesn't have to fetch them again
+        save_price_cache()
+
     # --- Current price ---
     print(f"\n[→] Current LTC price...")
     current_price = get_current_price(currency)
@@ -543,10 +845,12 @@ def main():
     # --- Calculate & save ---
     summary = calculate_summary(existing_txs, current_price, target_profit)
 
-    data["transactions"] = sorted(existing_txs, key=lambda t: t["timestamp"])
-    data["seen_txids"] = list(seen_txids)
+    data["transactions"] = existing_txs
+    # Sorted so data.json diffs stay stable between runs
+    data["seen_txids"] = sorted(seen_txids)
     data["summary"] = summary
     data["last_block_height"] = highest_block
+    data["per_address_n_tx"] = per_address_n_tx
     data["config"] = {
         "addresses": addresses,
         "target_profit_percent": target_profit,